@@ -30,25 +30,63 @@
 # Functions:                                                                                      #
 #   SlackScheduler.__init__ -- Initializes the SlackScheduler with a Slack API token.             #
 #   SlackScheduler.clear_schedule -- Clears all scheduled tasks in the scheduler.                 #
-#   SlackScheduler.convert_to_24h_format -- Converts time from 12-hour to 24-hour format.         #
-#   SlackScheduler.current_time_str -- Gets the current time as a formatted string.               #
 #   SlackScheduler.log_message -- Logs a message with a timestamp and action.                     #
 #   SlackScheduler.get_user_id -- Retrieves the user ID for a given username from Slack.          #
+#   SlackScheduler.invalidate_user_cache -- Forces the next user lookup to refetch users_list.    #
+#   SlackScheduler.warm_user_cache -- Fills the user cache and prepares messages in background.   #
+#   SlackScheduler.refresh_user_cache -- Rebuilds the cached username to user ID mapping.         #
+#   SlackScheduler.get_channel_id -- Resolves a channel name or ID to the channel's ID.           #
+#   SlackScheduler.refresh_channel_cache -- Rebuilds the cached channel name to ID mapping.       #
+#   SlackScheduler.format_message -- Converts @username and @here mentions into Slack tags.       #
+#   SlackScheduler.prepare_messages -- Formats all configured reminder messages ahead of time.    #
 #   SlackScheduler.send_message -- Sends a message to a specified Slack channel.                  #
+#   SlackScheduler.post_message -- Posts an already formatted message to a Slack channel.         #
 #   SlackScheduler.schedule_shift_reminders -- Schedules reminders for a specific shift type.     #
-#   SlackScheduler.scheduled_message_sender -- Returns a function that sends a scheduled message. #
-#   SlackScheduler.schedule_meeting_on_day -- Schedules a meeting reminder on a specific day.     #
+#   SlackScheduler.register_job -- Registers a channel and message pair in the job table.         #
+#   SlackScheduler.add_reminder -- Schedules a reminder, sharing one timer per time slot.         #
+#   SlackScheduler.fire_slot -- Queues the messages of all reminders sharing a time slot.         #
+#   SlackScheduler.fire_job -- Queues the message of a registered reminder job when it is due.    #
+#   SlackScheduler.queue_message -- Queues a scheduled message for the next per-channel flush.    #
+#   SlackScheduler.add_timer -- Registers a weekly timer on a weekday at a local time.            #
+#   SlackScheduler.next_fire_time -- Computes the next occurrence of a weekly timer.              #
+#   SlackScheduler.shared_fire_time -- Next occurrence of a weekly time, shared between timers.   #
 #   SlackScheduler.schedule_meeting_reminders -- Schedules all meeting reminders based on config. #
 #   SlackScheduler.listen_for_commands -- Listens for commands from the user input.               #
+#   SlackScheduler.read_commands -- Reads pending user input and queues complete commands.        #
+#   SlackScheduler.command_worker -- Handles the queued user commands one at a time, in order.    #
 #   SlackScheduler.send_to_channel -- Sends a message to a specific Slack channel.                #
+#   SlackScheduler.spawn -- Runs a coroutine as a tracked background task on the event loop.      #
+#   SlackScheduler.post_batch -- Formats queued messages and posts them as one Slack message.     #
+#   SlackScheduler.flush_outbox -- Hands queued scheduled messages to the sender, per channel.    #
+#   SlackScheduler.channel_queue -- Gets a channel's queue, starting its sender worker.           #
+#   SlackScheduler.sender_worker -- Posts the queued batches of one channel, rate limited.        #
+#   SlackScheduler.run_pending_tasks -- Runs due tasks, sleeping until the next one is due.       #
+#   SlackScheduler.push_schedule_to_slack -- Schedules the coming days of reminders on Slack.     #
+#   SlackScheduler.build_slack_batches -- Formats the reminders of each Slack time slot.          #
+#   SlackScheduler.claim_slack_scheduled_messages -- Matches listed messages to this bot's slots. #
+#   SlackScheduler.schedule_slack_message -- Schedules one formatted message on Slack.            #
+#   SlackScheduler.delete_slack_scheduled_message -- Deletes one of this bot's scheduled messages.#
+#   SlackScheduler.load_slack_scheduled_messages -- Reads the record and the messages on Slack.   #
+#   SlackScheduler.read_slack_schedule_record -- Reads the record of this bot's Slack messages.   #
+#   SlackScheduler.save_slack_schedule_record -- Saves the record of this bot's Slack messages.   #
+#   SlackScheduler.cancel_slack_scheduled_messages -- Deletes this bot's messages on Slack.       #
+#   SlackScheduler.push_schedule_loop -- Keeps the coming days of reminders scheduled on Slack.   #
+#   SlackScheduler.start -- Opens the shared HTTP session and starts warming the user cache.      #
+#   SlackScheduler.main -- Coroutine running the command listener and the scheduled tasks.        #
+#   SlackScheduler.shutdown -- Stops the command input, background tasks and the HTTP session.    #
 #   SlackScheduler.run -- Starts the Slack scheduler, executing scheduled tasks and commands.     #
 #                                                                                                 #
+#   MinuteFormatter.formatTime -- Formats a record's time, reusing it within the same minute.     #
+#                                                                                                 #
 #   CommandHandler.__init__ -- Initializes the CommandHandler with a reference to the scheduler.  #
 #   CommandHandler.handle_command -- Processes incoming commands and executes actions.            #
+#   CommandHandler.cmd_help -- Handles the 'help' command.                                        #
+#   CommandHandler.cmd_w -- Handles the '/w' command, sending a message to a channel.             #
 #-------------------------------------------------------------------------------------------------#
 # Class Descriptions:                                                                             #
 #   SlackScheduler - Manages Slack scheduling and message automation tasks.                       #
 #   CommandHandler - Processes incoming commands and directs them to the SlackScheduler.          #
+#   MinuteFormatter - Log formatter caching the formatted time of minute-granular formats.        #
 #-------------------------------------------------------------------------------------------------#
 # Detailed Description:                                                                           #
 #   This Python script, SlackScheduler.py, automates various scheduling and messaging tasks on    #
@@ -56,20 +94,76 @@
 #   message delivery. Utilizing the Slack API, it communicates with Slack channels and manages    #
 #   interactions. The script features a dynamic configuration system, supporting different types  #
 #   of shifts such as day, night, weekend, and overtime.                                          #
+#                                                                                                 #
+#   Everything runs as coroutines on a single asyncio event loop: reminders wait in a heap of     #
+#   timers, commands are read from stdin as it becomes readable, and messages are posted with     #
+#   the async Slack client over one shared HTTP session. No thread blocks on a sleep or a read.   #
 #-------------------------------------------------------------------------------------------------#
 
-import threading
+import asyncio
+import collections
+import functools
+import heapq
+import itertools
+import json
+import logging
+import os
 import re
-import schedule
+import stat
+import sys
 import time
+import types
 import datetime
-from slack_sdk import WebClient
+import aiohttp
+from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.errors import SlackApiError
 
+# Logger used by SlackScheduler.log_message
+_log = logging.getLogger("slackscheduler")
+
+# Matches "@username" mentions in outgoing messages; compiled once at module load. The greedy
+# \w+ always ends at a non-word character or the end of the message, so no lookahead is needed
+_USERNAME_RE = re.compile(r'@(\w+)')
+
+# Matches channel names, which start with '#' or contain lowercase letters; anything else,
+# e.g. channel IDs or user IDs for direct messages, is passed to Slack as-is
+_CHANNEL_NAME_RE = re.compile(r'#|.*[a-z]')
+
+# Read-only views of the config used by the scheduling methods; built by _compile_config
+ShiftConfig = collections.namedtuple("ShiftConfig", ["days", "messages"])
+MeetingConfig = collections.namedtuple("MeetingConfig", ["time_key", "time_24h", "days", "message"])
+CompiledConfig = collections.namedtuple("CompiledConfig", ["shifts", "meetings"])
+
+# Converts "02:00 PM" to "14:00"; memoized since the same times recur across shifts and days
+@functools.lru_cache(maxsize=None)
+def _to_24h(time_str):
+    return datetime.datetime.strptime(time_str, "%I:%M %p").strftime("%H:%M")
+
+# Log formatter for minute-granular date formats such as "%I:%M %p": the timestamp is only
+# formatted again once the minute changes, instead of once per record
+class MinuteFormatter(logging.Formatter):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._minute = None
+        self._minute_str = ""
+
+    def formatTime(self, record, datefmt=None):
+        minute = int(record.created // 60)
+        if minute != self._minute:
+            self._minute_str = super().formatTime(record, datefmt)
+            self._minute = minute
+        return self._minute_str
+
 class CommandHandler:
     def __init__(self, scheduler):
         self.scheduler = scheduler
 
+        # Maps each command to the coroutine handling its arguments; a single lookup per command
+        self._handlers = {
+            "help": self.cmd_help,
+            "/w": self.cmd_w,
+        }
+
     # ------------------------------------------------------------------------------------------
     # Function: handle_command
     # Description: Processes incoming commands and directs them to the appropriate action.
@@ -79,55 +173,78 @@ class CommandHandler:
     #   command (str): The command string to be processed.
     # 
     # Example usage:
-    #   General channel - /w C043NCYSH1V Good luck @george! :ah-ha-nya:
-    #   Private channel - /w C06CF9GUG8K Good luck @george! :ah-ha-nya:
+    #   General channel - /w -C C043NCYSH1V Good luck @george! :ah-ha-nya:
+    #   Private channel - /w -C C06CF9GUG8K Good luck @george! :ah-ha-nya:
     #
     # Returns: None
     #
-    # Warnings: None
+    # Warnings: This is a coroutine; it completes once the message has been posted.
     #
     # History:
     #   01/04/23 - Function created by George Manea
     # ------------------------------------------------------------------------------------------
-    def handle_command(self, command):
-        command = command.strip()
-        components = command.split(" ")
-        cmd = components.pop(0)
-
-        # Early checks for specific commands
-        if cmd == "help":
-            if components:
-                self.display_help_for_command(components[0])
-            else:
-                available_commands = ", ".join(self.scheduler.config["commands"].keys())
-                print(f"You have to select a command to display the help for. The current commands are: {available_commands}")
+    async def handle_command(self, command):
+        # Splits off the command name only; the handler parses the rest of the line itself
+        parts = command.split(maxsplit=1)
+        if not parts:
             return
+        cmd = parts[0]
+        args = parts[1] if len(parts) > 1 else ""
 
-        channel_id = None  # Initialize channel_id
-        message = []  # Use a list to collect message components for easier manipulation
+        handler = self._handlers.get(cmd)
+        if handler:
+            await handler(args)
+        else:
+            print(f"Unrecognized or unsupported command: {cmd}. Use 'help' to see available commands.")
 
-        # Loop through components to process switches and construct the message
-        i = 0  # Index for manual loop control
-        while i < len(components):
-            if components[i] == "-C" and (i + 1) < len(components):
-                channel_id = components[i + 1]  # Assign the next component as the channel_id
-                i += 2  # Skip the next component as it's already processed as channel_id
-            else:
-                message.append(components[i])
-                i += 1
+    # ------------------------------------------------------------------------------------------
+    # Function: cmd_help
+    # Description: Handles the 'help' command, displaying the help for the given command or
+    #              the list of available commands.
+    #
+    # Parameters:
+    #   args (str): The rest of the command line, e.g. "/w".
+    #
+    # Returns: None
+    # ------------------------------------------------------------------------------------------
+    async def cmd_help(self, args):
+        parts = args.split(maxsplit=1)
+        if parts:
+            self.display_help_for_command(parts[0])
+        else:
+            available_commands = ", ".join(self.scheduler.config["commands"].keys())
+            print(f"You have to select a command to display the help for. The current commands are: {available_commands}")
 
-        message_text = " ".join(message).strip()  # Convert message list back to a string
+    # ------------------------------------------------------------------------------------------
+    # Function: cmd_w
+    # Description: Handles the '/w' command, sending a message to the channel given with -C
+    #              or to the configured default channel.
+    #
+    # Parameters:
+    #   args (str): The rest of the command line, e.g. "-C C043NCYSH1V Good morning!".
+    #
+    # Returns: None
+    #
+    # Warnings: The -C switch must come before the message; the message is sent as typed,
+    #           spacing and quotes included.
+    # ------------------------------------------------------------------------------------------
+    async def cmd_w(self, args):
+        channel_id = None
+        message_text = args
 
-        if cmd == "/w":
-            if not channel_id:
-                channel_id = self.scheduler.config["commands"].get(cmd, {}).get("default_channel", None)
-            
-            if channel_id and message_text:
-                self.scheduler.send_to_channel(channel_id, message_text)
-            else:
-                print("You must specify a channel (-C channel_id) and a message to send.")
+        # Splits off the switch and its value, leaving the message itself untouched
+        parts = args.split(maxsplit=2)
+        if len(parts) >= 2 and parts[0] == "-C":
+            channel_id = parts[1]
+            message_text = parts[2] if len(parts) > 2 else ""
+
+        if not channel_id:
+            channel_id = self.scheduler.config["commands"].get("/w", {}).get("default_channel", None)
+
+        if channel_id and message_text:
+            await self.scheduler.send_to_channel(channel_id, message_text)
         else:
-            print(f"Unrecognized or unsupported command: {cmd}. Use 'help' to see available commands.")
+            print("You must specify a channel (-C channel_id) and a message to send.")
 
     def display_help_for_command(self, cmd):
         # Fetch the command configuration
@@ -151,7 +268,8 @@ class SlackScheduler:
             "weekend_shift": True,
             "overtime_shift": True,
             "meeting_reminders": False,
-            "random_messages": False
+            "random_messages": False,
+            "slack_scheduled_messages": False  # Lets Slack deliver the reminders (chat.scheduleMessage)
         },
         "commands": {
             "help": {
@@ -195,7 +313,7 @@ class SlackScheduler:
                     "02:00 AM": "Night shift concludes. Ensure all tasks are completed before logging off."
                 }
             },
-            "weekend": {
+            "weekend_shift": {
                 "days": ["saturday", "sunday"],
                 "messages": {
                     "11:00 AM": "Weekend operations start now. Dedication to tasks is essential.",
@@ -206,7 +324,7 @@ class SlackScheduler:
                     "05:00 PM": "Weekend operations conclude. Ensure all activities are logged appropriately."
                 }
             },
-            "overtime": {
+            "overtime_shift": {
                 "days": ["saturday", "sunday"],
                 "messages": {
                     "02:00 AM": "Overtime shift begins. Please concentrate on pending tasks.",
@@ -261,6 +379,53 @@ class SlackScheduler:
         ]
     }
 
+    # Maps configured day names to datetime.weekday() indexes; also the set of valid day names
+    _DAY_IDX = {
+        "monday": 0,
+        "tuesday": 1,
+        "wednesday": 2,
+        "thursday": 3,
+        "friday": 4,
+        "saturday": 5,
+        "sunday": 6
+    }
+
+    # Number of seconds a fetched users_list is reused before get_user_id refreshes it
+    USER_CACHE_TTL = 600
+
+    # Minimum age in seconds of the users_list before a lookup of an unknown username refreshes it
+    USER_CACHE_MISS_TTL = 60
+
+    # Minimum age in seconds of the channel list before a lookup of an unknown channel name
+    # refreshes it
+    CHANNEL_CACHE_MISS_TTL = 60
+
+    # Longest number of seconds run_pending_tasks sleeps before rechecking the wall clock; a
+    # clock step or a suspend delays a reminder by at most this long
+    TIMER_RECHECK_INTERVAL = 300
+
+    # Minimum number of seconds between two scheduled posts to the same channel
+    CHANNEL_POST_INTERVAL = 1
+
+    # Separator between reminders that fire together and are posted as one message
+    OUTBOX_SEPARATOR = "\n\n---\n\n"
+
+    # Number of seconds an idle connection to Slack is kept open for the next API call, and
+    # the most connections kept in the pool
+    HTTP_KEEPALIVE_TIMEOUT = 300
+    HTTP_POOL_SIZE = 16
+
+    # With slack_scheduled_messages enabled: how many days of reminders are handed to Slack,
+    # how often in seconds the window is topped up, and how many chat.scheduleMessage calls
+    # run at once
+    SCHEDULE_PUSH_HORIZON_DAYS = 7
+    SCHEDULE_PUSH_INTERVAL = 86400
+    SCHEDULE_PUSH_CONCURRENCY = 10
+
+    # File recording the messages this bot scheduled on Slack, so that a restart can update or
+    # delete them even after their text changed in the config
+    SCHEDULE_RECORD_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "slack_scheduled_messages.json")
+
     # ------------------------------------------------------------------------------------------
     # Constructor for SlackScheduler
     # Description: Initializes the SlackScheduler with a Slack API token.
@@ -271,39 +436,60 @@ class SlackScheduler:
     # Returns: None
     # ------------------------------------------------------------------------------------------
     def __init__(self, slack_token):
-        # Initializes WebClient with provided Slack API token
-        self.client = WebClient(token=slack_token)
+        # Initializes AsyncWebClient with provided Slack API token; run() attaches a shared
+        # HTTP session so that every API call reuses the same keep-alive connection
+        self.client = AsyncWebClient(token=slack_token)
+        self._http_session = None
+
+        # Cache of username -> user ID, rebuilt from users_list once it expires
+        self._user_cache = {}
+        self._user_cache_ts = 0
+        self._user_cache_lock = asyncio.Lock()
+
+        # Time before which no users_list refresh is attempted, after a failed one
+        self._user_cache_retry_at = 0
+
+        # Cache of channel name -> channel ID, filled from conversations_list the first time a
+        # channel is given by name; channel IDs never need a lookup
+        self._channel_cache = {}
+        self._channel_cache_ts = 0
+        self._channel_cache_lock = asyncio.Lock()
+
+        # Background tasks started by spawn, referenced until they complete
+        self._tasks = set()
         
+        # Scheduled messages waiting to be posted, per channel, and the queue of batches of
+        # each channel's sender worker, created when the channel is first posted to
+        self._outbox = collections.defaultdict(list)
+        self._send_queues = {}
+
+        # Reminders this bot handed to Slack with chat.scheduleMessage: (channel, post_at) ->
+        # (scheduled message ID, text), kept in SCHEDULE_RECORD_FILE; None until it is read
+        self._slack_scheduled = None
+
+        # Listed messages not in the record, e.g. scheduled by other tools using the same token:
+        # (channel, post_at) -> [(scheduled message ID, text)]; None until
+        # chat.scheduledMessages.list has been loaded
+        self._slack_unclaimed = None
+
+        # Partial command line read from stdin; None while stdin is not watched
+        self._stdin_buffer = None
+
+        # Set by add_timer to wake run_pending_tasks when a timer is due before its sleep ends
+        self._wake = asyncio.Event()
+
+        # Caps the number of chat.postMessage calls in flight at once
+        self._post_semaphore = asyncio.Semaphore(int(os.environ.get("SLACK_MAX_CONCURRENT_REQUESTS", "3")))
+
         # Creates a CommandHandler instance with a reference to this scheduler
         self.command_handler = CommandHandler(self)
         
         # Clears any previously scheduled tasks upon initialization
         self.clear_schedule()
 
-    # ------------------------------------------------------------------------------------------
-    # Function: convert_to_24h_format
-    # Description: Converts a time string from 12-hour format to 24-hour format.
-    #
-    # Parameters:
-    #   time_str (str): The time string in 12-hour format (e.g., "02:00 PM").
-    #
-    # Returns:
-    #   str: The time string in 24-hour format (e.g., "14:00").
-    # ------------------------------------------------------------------------------------------
-    def convert_to_24h_format(self, time_str):
-        # Converts a time string from 12-hour format (e.g., '02:00 PM') to 24-hour format (e.g., '14:00')
-        return datetime.datetime.strptime(time_str, "%I:%M %p").strftime("%H:%M")
-
-    # ------------------------------------------------------------------------------------------
-    # Function: current_time_str
-    # Description: Gets the current time as a formatted string.
-    #
-    # Returns:
-    #   str: The current time in the format "HH:MM AM/PM".
-    # ------------------------------------------------------------------------------------------
-    def current_time_str(self):
-        # Retrieves the current time and formats it as a string in "HH:MM AM/PM" format
-        return datetime.datetime.now().strftime("%I:%M %p")
+        # Formatted reminder messages, filled in the background by warm_user_cache once run()
+        # starts, so construction and scheduling do not wait on the Slack API
+        self._prepared_messages = {}
 
     # ------------------------------------------------------------------------------------------
     # Function: log_message
@@ -314,11 +500,15 @@ class SlackScheduler:
     #   message (str): The message to log.
     #
     # Returns: None
+    #
+    # Warnings: Records go to the "slackscheduler" logger at INFO level; the timestamp is
+    #           added by the handler's formatter (see the example at the end of this file).
     # ------------------------------------------------------------------------------------------
     def log_message(self, action, message):
-        # Logs a message with a timestamp and the specified action
+        # Logs a message with the specified action
         # Useful for tracking events and errors within the application
-        print(f"{self.current_time_str()} - {action}: {message}")
+        # The record is only formatted if a handler is going to emit it
+        _log.info("%s: %s", action, message)
 
     # ------------------------------------------------------------------------------------------
     # Function: get_user_id
@@ -329,23 +519,238 @@ class SlackScheduler:
     #
     # Returns:
     #   str or None: The user ID if found, otherwise None.
+    #
+    # Warnings: Results are served from a cache that is refreshed every USER_CACHE_TTL seconds.
+    #           A username missing from the cache triggers a refresh as well, but at most
+    #           once every USER_CACHE_MISS_TTL seconds, so unknown names cannot flood the API.
+    #           After a failed refresh, the previous cache is served until the retry time set
+    #           by refresh_user_cache.
     # ------------------------------------------------------------------------------------------
-    def get_user_id(self, username):
-        # Attempts to retrieve a user ID from Slack for a given username
+    async def get_user_id(self, username):
+        # Serves fresh cache hits without waiting on the lock
+        user_id = self._user_cache.get(username)
+        if user_id is not None and time.time() - self._user_cache_ts < self.USER_CACHE_TTL:
+            return user_id
+
+        # Serializes access to the cache so concurrent lookups trigger at most one refresh
+        async with self._user_cache_lock:
+            # Rebuilds the username -> ID cache once it is older than the TTL, or sooner on a miss,
+            # unless a failed refresh is still backing off
+            now = time.time()
+            age = now - self._user_cache_ts
+            if now >= self._user_cache_retry_at and (
+                    age >= self.USER_CACHE_TTL or (username not in self._user_cache and age >= self.USER_CACHE_MISS_TTL)):
+                await self.refresh_user_cache()
+
+            # Returns the ID of the user if found, otherwise None
+            return self._user_cache.get(username)
+
+    # ------------------------------------------------------------------------------------------
+    # Function: invalidate_user_cache
+    # Description: Marks the user cache as stale, so the next lookup fetches users_list again.
+    #
+    # Returns: None
+    # ------------------------------------------------------------------------------------------
+    def invalidate_user_cache(self):
+        self._user_cache_ts = 0
+
+    # ------------------------------------------------------------------------------------------
+    # Function: warm_user_cache
+    # Description: Populates the user cache and prepares the configured reminder messages.
+    #              Runs as a background task started by run(), so the first reminder does
+    #              not pay for the users_list download.
+    #
+    # Returns: None
+    # ------------------------------------------------------------------------------------------
+    async def warm_user_cache(self):
+        # Any lookup fills the cache when it is empty; the username itself does not matter
+        await self.get_user_id("___warmup___")
+        await self.prepare_messages()
+
+    # ------------------------------------------------------------------------------------------
+    # Function: refresh_user_cache
+    # Description: Fetches the full member list from Slack, following pagination cursors,
+    #              and rebuilds the username -> user ID cache used by get_user_id.
+    #
+    # Returns: None
+    #
+    # Warnings: Callers must hold _user_cache_lock. On an error the previous cache is kept,
+    #           and no refresh is attempted for USER_CACHE_MISS_TTL seconds, or for the
+    #           Retry-After delay when Slack rate limits the call (HTTP 429).
+    # ------------------------------------------------------------------------------------------
+    async def refresh_user_cache(self):
+        user_cache = {}
+        cursor = None
+        # Set before fetching, so a refresh failing in any way is not retried on every lookup
+        self._user_cache_retry_at = time.time() + self.USER_CACHE_MISS_TTL
         try:
-            # Fetches list of users from Slack
-            response = self.client.users_list()
-            members = response["members"]
-            
-            # Searches for the specified username in the members list
-            for member in members:
-                if 'name' in member and member['name'] == username:
-                    # Returns the ID of the user if found
-                    return member['id']
+            while True:
+                # Fetches one page of users from Slack
+                response = await self.client.users_list(cursor=cursor, limit=200)
+                for member in response["members"]:
+                    if 'name' in member:
+                        user_cache[member['name']] = member['id']
+
+                # Continues with the next page until Slack returns an empty cursor
+                cursor = response.get("response_metadata", {}).get("next_cursor")
+                if not cursor:
+                    break
         except SlackApiError as e:
+            # Waits as long as Slack asks before the next attempt when the call is rate limited
+            if e.response.status_code == 429:
+                retry_after = int(e.response.headers.get("Retry-After", 1))
+                self._user_cache_retry_at = time.time() + retry_after
             # Logs error if user list retrieval fails
             self.log_message("Error retrieving user list", f"{e.response['error']}")
-        return None
+            return
+
+        self._user_cache = user_cache
+        self._user_cache_ts = time.time()
+        self._user_cache_retry_at = 0
+
+    # ------------------------------------------------------------------------------------------
+    # Function: get_channel_id
+    # Description: Resolves a channel given by ID or by name (e.g., "general" or "#general")
+    #              to the channel's ID.
+    #
+    # Parameters:
+    #   channel (str): The channel ID or name, or a user ID to send a direct message to.
+    #
+    # Returns:
+    #   str or None: The channel ID if found, otherwise None.
+    #
+    # Warnings: Only values starting with '#' or containing lowercase letters are looked up;
+    #           IDs (channel or user) are returned as-is, without calling the Slack API.
+    #           Names are served from a cache; an unknown name refreshes it at most once every
+    #           CHANNEL_CACHE_MISS_TTL seconds.
+    # ------------------------------------------------------------------------------------------
+    async def get_channel_id(self, channel):
+        if not _CHANNEL_NAME_RE.match(channel):
+            return channel
+
+        name = channel.lstrip("#")
+        channel_id = self._channel_cache.get(name)
+        if channel_id is not None:
+            return channel_id
+
+        # Serializes the refresh so concurrent lookups fetch the channel list once
+        async with self._channel_cache_lock:
+            if name not in self._channel_cache and time.time() - self._channel_cache_ts >= self.CHANNEL_CACHE_MISS_TTL:
+                await self.refresh_channel_cache()
+            return self._channel_cache.get(name)
+
+    # ------------------------------------------------------------------------------------------
+    # Function: refresh_channel_cache
+    # Description: Fetches the public and private channels visible to the token, following
+    #              pagination cursors, and rebuilds the name -> channel ID cache used by
+    #              get_channel_id.
+    #
+    # Returns: None
+    #
+    # Warnings: Callers must hold _channel_cache_lock. On a Slack API error the previous
+    #           cache is kept.
+    # ------------------------------------------------------------------------------------------
+    async def refresh_channel_cache(self):
+        channel_cache = {}
+        cursor = None
+        self._channel_cache_ts = time.time()
+        try:
+            while True:
+                response = await self.client.conversations_list(
+                    cursor=cursor, limit=1000, exclude_archived=True, types="public_channel,private_channel")
+                for conversation in response["channels"]:
+                    channel_cache[conversation["name"]] = conversation["id"]
+
+                cursor = response.get("response_metadata", {}).get("next_cursor")
+                if not cursor:
+                    break
+        except SlackApiError as e:
+            self.log_message("Error retrieving channel list", f"{e.response['error']}")
+            return
+
+        self._channel_cache = channel_cache
+
+    # ------------------------------------------------------------------------------------------
+    # Function: format_message
+    # Description: Formats a message for Slack by replacing usernames with user ID tags
+    #              and "@here" with the Slack channel-wide tag. Messages from the config
+    #              use the text prepared by prepare_messages.
+    #
+    # Parameters:
+    #   message (str): The message to be formatted.
+    #
+    # Returns:
+    #   str: The message with every resolvable mention converted to Slack format.
+    # ------------------------------------------------------------------------------------------
+    async def format_message(self, message):
+        # Config messages are formatted ahead of time; anything else is formatted now
+        formatted_message = self._prepared_messages.get(message)
+        if formatted_message is not None:
+            return formatted_message
+
+        # Messages without an '@' (most shift and meeting reminders) need no tag resolution
+        if '@' not in message:
+            return message
+
+        # Scans the message for mentions once; the matches are reused for the substitution below
+        matches = list(_USERNAME_RE.finditer(message))
+
+        # Resolves each distinct username once; "@here" maps straight to the Slack tag
+        replacements = {"here": "<!here>"}
+        for username in dict.fromkeys(match.group(1) for match in matches):
+            if username in replacements:
+                continue
+            user_id = await self.get_user_id(username)
+            if user_id:
+                # Slack formatted user ID tag for proper tagging
+                replacements[username] = f"<@{user_id}>"
+            else:
+                # Logs a message if the username could not be resolved to a user ID
+                self.log_message("User not found", f"Username @{username} could not be resolved to a user ID.")
+
+        # Rebuilds the message from the text between the matches and the resolved mentions
+        parts = []
+        last_end = 0
+        for match in matches:
+            parts.append(message[last_end:match.start()])
+            parts.append(replacements.get(match.group(1), match.group(0)))
+            last_end = match.end()
+        parts.append(message[last_end:])
+        return "".join(parts)
+
+    # ------------------------------------------------------------------------------------------
+    # Function: prepare_messages
+    # Description: Formats every shift and meeting message from the config once, so that
+    #              scheduled reminders do not have to resolve usernames when they fire.
+    #              The distinct mentions of all messages are resolved together first.
+    #
+    # Returns: None
+    #
+    # Warnings: Messages mentioning a username that cannot be resolved yet are not prepared;
+    #           they are formatted when they fire, so the lookup is retried then.
+    # ------------------------------------------------------------------------------------------
+    async def prepare_messages(self):
+        # Messages without an '@' are sent unchanged and need no entry
+        messages = []
+        for shift_config in self.config["shift_message_config"].values():
+            messages.extend(shift_config.get("messages", {}).values())
+        for info in self.config["meeting_reminders"].values():
+            messages.append(info["message"])
+        messages = [message for message in dict.fromkeys(messages) if '@' in message]
+
+        # Resolves each distinct mention across the whole config once
+        mentions = {message: {match.group(1) for match in _USERNAME_RE.finditer(message)} for message in messages}
+        unresolved = set()
+        for username in set().union(*mentions.values()) - {"here"}:
+            if await self.get_user_id(username) is None:
+                unresolved.add(username)
+
+        # Maps each fully resolvable message to its Slack formatted text
+        prepared_messages = {}
+        for message in messages:
+            if mentions[message].isdisjoint(unresolved):
+                prepared_messages[message] = await self.format_message(message)
+        self._prepared_messages = prepared_messages
 
     # ------------------------------------------------------------------------------------------
     # Function: send_message
@@ -364,31 +769,57 @@ class SlackScheduler:
     # History:
     #   01/04/23 - Function created by George Manea
     # ------------------------------------------------------------------------------------------
-    def send_message(self, channel_id, message):
-        # Searches for usernames in the message and replaces them with Slack user IDs for proper tagging
-        usernames = re.findall(r'@(\w+)(?=\s|\.|!|\/|\W)', message)
-        for username in usernames:
-            user_id = self.get_user_id(username)
-            if user_id:
-                # Replaces username with Slack formatted user ID tag
-                message = message.replace(f"@{username}", f"<@{user_id}>")
-            else:
-                # Logs a message if the username could not be resolved to a user ID
-                self.log_message("User not found", f"Username @{username} could not be resolved to a user ID.")
-        
-        # Formatting message to replace "@here" with the appropriate Slack tag
-        formatted_message = message.replace("@here", "<!here>")
+    async def send_message(self, channel_id, message):
+        # Formats the message and sends it to the specified Slack channel
+        await self.post_message(channel_id, await self.format_message(message))
+
+    # ------------------------------------------------------------------------------------------
+    # Function: post_message
+    # Description: Posts an already formatted message to a specified Slack channel.
+    #
+    # Parameters:
+    #   channel_id (str): The ID or name of the channel where the message will be sent.
+    #   formatted_message (str): The message text in Slack format.
+    #
+    # Returns: None
+    #
+    # Warnings: Handles SlackApiError if an issue occurs with the Slack API. When Slack
+    #           rate limits the call (HTTP 429), waits for Retry-After seconds and retries.
+    #           At most SLACK_MAX_CONCURRENT_REQUESTS (environment, default 3) posts are
+    #           in flight at once.
+    # ------------------------------------------------------------------------------------------
+    async def post_message(self, channel_id, formatted_message):
+        # Resolves a channel name to its ID; IDs and names seen before cost no API call
+        channel = channel_id
+        channel_id = await self.get_channel_id(channel)
+        if channel_id is None:
+            self.log_message("Channel not found", f"Channel {channel} could not be resolved to a channel ID.")
+            return
 
         # Attempting to send the formatted message to the specified Slack channel
         self.log_message("Attempting to send message", formatted_message)
-        try:
-            # Sends the message to the specified Slack channel
-            response = self.client.chat_postMessage(channel=channel_id, text=formatted_message)
-            # Logs the successful message transmission
-            self.log_message("HTTP POST", response['message']['text'])
-        except SlackApiError as e:
-            # Logs an error message if the message sending fails
-            self.log_message("Error sending message", f"{e.response['error']}")
+        while True:
+            try:
+                # Sends the message to the specified Slack channel
+                async with self._post_semaphore:
+                    response = await self.client.chat_postMessage(channel=channel_id, text=formatted_message)
+                # Logs the successful message transmission
+                self.log_message("HTTP POST", response['message']['text'])
+                return
+            except SlackApiError as e:
+                # Retries after the delay Slack asks for when the call is rate limited
+                if e.response.status_code == 429:
+                    retry_after = int(e.response.headers.get("Retry-After", 1))
+                    self.log_message("Rate limited", f"Retrying message to {channel_id} in {retry_after}s")
+                    await asyncio.sleep(retry_after)
+                    continue
+
+                # Logs an error message if the message sending fails
+                self.log_message("Error sending message", f"{e.response['error']}")
+                # A user ID from the cache no longer exists; refetches the user list on the next lookup
+                if e.response['error'] == "user_not_found":
+                    self.invalidate_user_cache()
+                return
 
     # ------------------------------------------------------------------------------------------
     # Function: clear_schedule
@@ -407,7 +838,20 @@ class SlackScheduler:
     def clear_schedule(self):
         # Clears all scheduled tasks in the scheduler.
         # This function is typically used when needing to reset or update the schedule.
-        schedule.clear()
+        # Timers are (fire time, sequence, weekday, 24-hour time, sender) tuples in a min-heap
+        self._timers = []
+        self._timer_seq = itertools.count()
+
+        # Last fire time computed per (weekday, 24-hour time), as (after, fire time) pairs
+        self._fire_times = {}
+
+        # Forgets the registered reminders, their jobs and their time slots, so they can be
+        # scheduled again
+        self._scheduled_reminders = set()
+        self._jobs = []
+        self._job_ids = {}
+        self._slot_jobs = []
+        self._slot_ids = {}
 
     # ------------------------------------------------------------------------------------------
     # Function: schedule_shift_reminders
@@ -420,7 +864,8 @@ class SlackScheduler:
     #
     # Returns: None
     #
-    # Warnings: None
+    # Warnings: Reminders already registered for the same channel, day, time and message
+    #           are skipped, until clear_schedule is called.
     #
     # History:
     #   01/04/23 - Function created by George Manea
@@ -433,64 +878,184 @@ class SlackScheduler:
             return
 
         # Retrieves shift configuration based on the specified shift type (e.g., 'day_shift')
-        shift_config = self.config["shift_message_config"].get(shift_type, {})
+        shift = self.compiled_config.shifts.get(shift_type)
+        if shift is None:
+            self.log_message("Scheduling", f"No messages are configured for {shift_type}. Skipping scheduling.")
+            return
 
-        # Iterates through each day and message in the shift configuration
-        for day in shift_config.get("days", []):
-            for time_key, message in shift_config.get("messages", {}).items():
-                # Converts time to 24-hour format and schedules the reminder
-                converted_time = self.convert_to_24h_format(time_key)
-                schedule.every().day.at(converted_time).do(
-                    self.scheduled_message_sender(channel_id, message, day))
+        # Iterates through each day and message in the shift configuration; the times were
+        # converted to 24-hour format when the module was loaded (see _compile_config)
+        shift_messages = shift.messages
+        for day in shift.days:
+            for converted_time, message in shift_messages:
+                # Schedules the reminder on that weekday only, sharing the timer of any other
+                # reminder due at the same time in the same channel
+                self.add_reminder(channel_id, day, converted_time, message)
 
     # ------------------------------------------------------------------------------------------
-    # Function: scheduled_message_sender
-    # Description: Creates a function that sends a scheduled message to a specified channel.
-    #              This function checks the current day and sends the message if it matches
-    #              the specified day.
+    # Function: register_job
+    # Description: Registers a (channel, message) pair in the job table, once; reminders for it
+    #              on other days and times share the entry.
     #
     # Parameters:
     #   channel_id (str): The ID of the channel where the message will be sent.
     #   message (str): The message to be sent.
-    #   day (str): The day of the week when the message should be sent.
     #
     # Returns:
-    #   function: A function that sends the message if the day matches.
+    #   int: The ID of the job.
+    # ------------------------------------------------------------------------------------------
+    def register_job(self, channel_id, message):
+        job_key = (channel_id, message)
+        job_id = self._job_ids.get(job_key)
+        if job_id is None:
+            job_id = self._job_ids[job_key] = len(self._jobs)
+            self._jobs.append(job_key)
+        return job_id
+
+    # ------------------------------------------------------------------------------------------
+    # Function: add_reminder
+    # Description: Schedules a reminder on a day of the week. All reminders due at the same
+    #              time in the same channel, shift and meeting reminders alike, share one
+    #              timer and are posted together as one message.
     #
-    # Warnings: None
+    # Parameters:
+    #   channel_id (str): The ID of the channel where the reminder will be sent.
+    #   day (str): The day of the week (e.g., "monday").
+    #   time_24h (str): The time in 24-hour format (e.g., "14:00").
+    #   message (str): The reminder message.
     #
-    # History:
-    #   01/04/23 - Function created by George Manea
+    # Returns:
+    #   bool: False if the same reminder was already scheduled, True otherwise.
     # ------------------------------------------------------------------------------------------
-    def scheduled_message_sender(self, channel_id, message, day):
-        # Creates a closure function that sends a message on the specified day
-        def send():
-            # Checks if the current day matches the specified day for the message
-            if datetime.datetime.now().strftime("%A").lower() == day:
-                # Sends the message to the specified channel
-                self.send_message(channel_id, message)
-        return send
+    def add_reminder(self, channel_id, day, time_24h, message):
+        # Skips reminders that are already registered, e.g. when scheduling a shift twice
+        schedule_key = (channel_id, day, time_24h, message)
+        if schedule_key in self._scheduled_reminders:
+            return False
+        self._scheduled_reminders.add(schedule_key)
+
+        # Starts a timer for the first reminder of a slot; later ones join its job list
+        slot_key = (channel_id, day, time_24h)
+        slot_id = self._slot_ids.get(slot_key)
+        if slot_id is None:
+            slot_id = self._slot_ids[slot_key] = len(self._slot_jobs)
+            self._slot_jobs.append([])
+            self.add_timer(day, time_24h, functools.partial(self.fire_slot, slot_id))
+        self._slot_jobs[slot_id].append(self.register_job(channel_id, message))
+        return True
 
     # ------------------------------------------------------------------------------------------
-    # Function: schedule_meeting_on_day
-    # Description: Schedules a meeting reminder on a specified day of the week.
+    # Function: fire_slot
+    # Description: Queues the messages of every reminder sharing a time slot. Called by
+    #              run_pending_tasks when the slot is due.
     #
     # Parameters:
-    #   day (str): The day of the week to schedule the meeting.
-    #   time (str): The time to send the reminder.
-    #   message_sender (function): The function that sends the reminder message.
+    #   slot_id (int): The index of the slot in the table built by add_reminder.
     #
     # Returns: None
+    # ------------------------------------------------------------------------------------------
+    def fire_slot(self, slot_id):
+        for job_id in self._slot_jobs[slot_id]:
+            self.fire_job(job_id)
+
+    # ------------------------------------------------------------------------------------------
+    # Function: fire_job
+    # Description: Queues the message of a registered reminder job. Called by fire_slot
+    #              when the reminder is due.
     #
-    # Warnings: None
+    # Parameters:
+    #   job_id (int): The index of the job in the table built by register_job.
     #
-    # History:
-    #   01/04/23 - Function created by George Manea
+    # Returns: None
+    # ------------------------------------------------------------------------------------------
+    def fire_job(self, job_id):
+        channel_id, message = self._jobs[job_id]
+        self.queue_message(channel_id, message)
+
+    # ------------------------------------------------------------------------------------------
+    # Function: queue_message
+    # Description: Queues a scheduled message in the outbox of the specified channel, to be
+    #              posted by the next flush_outbox.
+    #
+    # Parameters:
+    #   channel_id (str): The ID of the channel where the message will be sent.
+    #   message (str): The message to be sent.
+    #
+    # Returns: None
+    # ------------------------------------------------------------------------------------------
+    def queue_message(self, channel_id, message):
+        self._outbox[channel_id].append(message)
+
+    # ------------------------------------------------------------------------------------------
+    # Function: add_timer
+    # Description: Registers a weekly timer that calls a function on a day of the week at a
+    #              given local time.
+    #
+    # Parameters:
+    #   day (str): The day of the week (e.g., "monday").
+    #   time_24h (str): The local time in 24-hour format (e.g., "14:00").
+    #   func (function): The function to call when the timer is due.
+    #
+    # Returns: None
+    # ------------------------------------------------------------------------------------------
+    def add_timer(self, day, time_24h, func):
+        weekday = self._DAY_IDX[day]
+        fire_at = self.shared_fire_time(weekday, time_24h, time.time())
+        timer = (fire_at, next(self._timer_seq), weekday, time_24h, func)
+        heapq.heappush(self._timers, timer)
+
+        # Cuts the scheduler's sleep short when the new timer is due before all the others
+        if self._timers[0] is timer:
+            self._wake.set()
+
+    # ------------------------------------------------------------------------------------------
+    # Function: next_fire_time
+    # Description: Computes the next moment, strictly after a given time, at which a weekly
+    #              timer is due.
+    #
+    # Parameters:
+    #   weekday (int): The day of the week as a datetime.weekday() index.
+    #   time_24h (str): The local time in 24-hour format (e.g., "14:00").
+    #   after (float): The epoch timestamp the result must be later than.
+    #
+    # Returns:
+    #   float: The epoch timestamp of the next occurrence.
+    #
+    # Warnings: The occurrence is computed on the local wall clock, so timers keep their
+    #           local time across daylight saving changes.
+    # ------------------------------------------------------------------------------------------
+    def next_fire_time(self, weekday, time_24h, after):
+        hour, minute = map(int, time_24h.split(":"))
+        moment = datetime.datetime.fromtimestamp(after)
+        candidate = moment.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        candidate += datetime.timedelta(days=(weekday - moment.weekday()) % 7)
+        if candidate.timestamp() <= after:
+            candidate += datetime.timedelta(days=7)
+        return candidate.timestamp()
+
+    # ------------------------------------------------------------------------------------------
+    # Function: shared_fire_time
+    # Description: Same as next_fire_time, but reuses the last result for the same weekday and
+    #              time. Every channel and shift due at a given time gets the same fire time,
+    #              so it is only computed once for all of them.
+    #
+    # Parameters:
+    #   weekday (int): The day of the week as a datetime.weekday() index.
+    #   time_24h (str): The local time in 24-hour format (e.g., "14:00").
+    #   after (float): The epoch timestamp the result must be later than.
+    #
+    # Returns:
+    #   float: The epoch timestamp of the next occurrence.
     # ------------------------------------------------------------------------------------------
-    def schedule_meeting_on_day(self, day, time, message_sender):
-        # Schedules a meeting reminder for a specific day and time
-        # The day parameter is the day of the week (e.g., 'monday'), and time is in 24-hour format
-        getattr(schedule.every(), day).at(self.convert_to_24h_format(time)).do(message_sender)
+    def shared_fire_time(self, weekday, time_24h, after):
+        # The occurrence following a moment is also the next one for any moment up to it
+        key = (weekday, time_24h)
+        cached = self._fire_times.get(key)
+        if cached is not None and cached[0] <= after < cached[1]:
+            return cached[1]
+        fire_at = self.next_fire_time(weekday, time_24h, after)
+        self._fire_times[key] = (after, fire_at)
+        return fire_at
 
     # ------------------------------------------------------------------------------------------
     # Function: schedule_meeting_reminders
@@ -513,47 +1078,107 @@ class SlackScheduler:
             self.log_message("Scheduling", "Meeting reminders are disabled in the config. Skipping scheduling.")
             return
 
-        # Set to track unique combinations of day and time to prevent duplicate scheduling
-        scheduled_times = set()
-
         # Iterates through the meeting reminders in the configuration
-        for time_key, info in self.config["meeting_reminders"].items():
-            for day in info["days"]:
-                # Creates a message sender function for each meeting reminder
-                message_sender = self.scheduled_message_sender(channel_id, info["message"], day)
-                schedule_key = f"{day}_{time_key}"
-
-                # Schedules the meeting reminder if it hasn't been scheduled already
-                if schedule_key not in scheduled_times:
-                    self.schedule_meeting_on_day(day, time_key, message_sender)
-                    scheduled_times.add(schedule_key)
+        for meeting in self.compiled_config.meetings:
+            for day in meeting.days:
+                # Schedules the meeting reminder if it hasn't been scheduled already; it shares
+                # the timer of any shift reminder due at the same time in the same channel
+                if self.add_reminder(channel_id, day, meeting.time_24h, meeting.message):
                     # Logs the scheduling of the meeting reminder
-                    self.log_message("Scheduling", f"Scheduled meeting reminder '{info['message']}' at {time_key} on {day}")
+                    self.log_message("Scheduling", f"Scheduled meeting reminder '{meeting.message}' at {meeting.time_key} on {day}")
 
     # ------------------------------------------------------------------------------------------
     # Function: listen_for_commands
-    # Description: Continuously listens for user input and processes commands in real-time.
+    # Description: Registers standard input with the event loop so that user commands are
+    #              processed in real-time, alongside the scheduled tasks.
+    #
+    # Parameters:
+    #   loop (asyncio.AbstractEventLoop): The event loop that drives the scheduler.
     #
     # Returns: None
     #
-    # Warnings: This function runs indefinitely in a loop.
+    # Warnings: When stdin is redirected from a regular file, its commands are all queued at
+    #           once. Command input is disabled when stdin cannot be watched by the event
+    #           loop, e.g. the console on the Windows proactor loop.
     #
     # History:
     #   01/04/23 - Function created by George Manea
     # ------------------------------------------------------------------------------------------
-    def listen_for_commands(self):
-        # Listens indefinitely for user input and processes any incoming commands
+    def listen_for_commands(self, loop):
+        # Commands are handed from the reader to a single worker, which runs them in order
+        self._command_queue = asyncio.Queue()
+        self.spawn(self.command_worker())
+
+        # Watches stdin on the event loop's selector instead of blocking a thread on input()
+        self._stdin_buffer = b""
+        fd = sys.stdin.fileno()
+        try:
+            loop.add_reader(fd, self.read_commands, loop)
+        except (OSError, NotImplementedError):
+            # A regular file is always readable, so epoll refuses to watch it; its commands
+            # are read at once instead. Other inputs, e.g. the Windows console with the
+            # proactor loop, cannot be watched at all
+            if stat.S_ISREG(os.fstat(fd).st_mode):
+                while self._stdin_buffer is not None:
+                    self.read_commands(loop)
+                return
+            self._stdin_buffer = None
+            self.log_message("Commands", "Standard input cannot be watched; command input is disabled.")
+            return
         print("Listening for commands...")
+
+    # ------------------------------------------------------------------------------------------
+    # Function: read_commands
+    # Description: Reads the available input from stdin and queues every complete line
+    #              as a command. Called by the event loop whenever stdin is readable.
+    #
+    # Parameters:
+    #   loop (asyncio.AbstractEventLoop): The event loop stdin is registered with.
+    #
+    # Returns: None
+    # ------------------------------------------------------------------------------------------
+    def read_commands(self, loop):
+        fd = sys.stdin.fileno()
+        data = os.read(fd, 4096)
+        if not data:
+            # Stops listening once stdin is closed, otherwise the loop would spin on EOF
+            loop.remove_reader(fd)
+            if self._stdin_buffer:
+                self._command_queue.put_nowait(self._stdin_buffer.decode(errors="replace"))
+            self._stdin_buffer = None
+            return
+
+        # Queues each complete line; a partial line waits for the rest of its input
+        self._stdin_buffer += data
+        *lines, self._stdin_buffer = self._stdin_buffer.split(b"\n")
+        # The reader only queues, so a slow Slack call in a command never stalls it
+        for line in lines:
+            self._command_queue.put_nowait(line.decode(errors="replace"))
+
+    # ------------------------------------------------------------------------------------------
+    # Function: command_worker
+    # Description: Handles the commands queued by read_commands, one at a time and in the
+    #              order they were typed.
+    #
+    # Returns: None
+    #
+    # Warnings: This coroutine runs until it is cancelled.
+    # ------------------------------------------------------------------------------------------
+    async def command_worker(self):
         while True:
-            # Waits for user input
-            cmd = input()
-            # Handles the received command
-            self.command_handler.handle_command(cmd)
+            command = await self._command_queue.get()
+            try:
+                await self.command_handler.handle_command(command)
+            except Exception as e:
+                # Keeps the worker alive; a failed command must not stop the following ones
+                self.log_message("Error handling command", repr(e))
+            finally:
+                self._command_queue.task_done()
 
     # ------------------------------------------------------------------------------------------
     # Function: send_to_channel
     # Description: Sends a message to a specified channel on Slack.
-    #              Utilizes the 'send_message' function to handle the message formatting and delivery.
+    #              An alias of 'send_message', which handles the message formatting and delivery.
     #
     # Parameters:
     #   channel_id (str): The ID of the Slack channel to send the message to.
@@ -561,40 +1186,651 @@ class SlackScheduler:
     #
     # Returns: None
     #
-    # Warnings: None
+    # Warnings: This is a coroutine; it completes once the Slack API call has returned.
+    #           Being bound at class creation, it is not affected by a subclass overriding
+    #           send_message.
     #
     # History:
     #   01/04/23 - Function created by George Manea
     # ------------------------------------------------------------------------------------------
-    def send_to_channel(self, channel_id, message):
-        # Sends a message to a specific Slack channel using the existing send_message method
-        self.send_message(channel_id, message)
+    # Sends a message to a specific Slack channel with send_message itself, saving a call
+    send_to_channel = send_message
+
+    # ------------------------------------------------------------------------------------------
+    # Function: spawn
+    # Description: Runs a coroutine as a background task on the running event loop, keeping
+    #              a reference to it until it completes and logging any unexpected error.
+    #
+    # Parameters:
+    #   coro (coroutine): The coroutine to run.
+    #
+    # Returns:
+    #   asyncio.Task: The task running the coroutine.
+    # ------------------------------------------------------------------------------------------
+    def spawn(self, coro):
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
+        return task
+
+    # ------------------------------------------------------------------------------------------
+    # Function: _task_done
+    # Description: Done callback for tasks started by spawn.
+    #
+    # Parameters:
+    #   task (asyncio.Task): The task that completed.
+    #
+    # Returns: None
+    # ------------------------------------------------------------------------------------------
+    def _task_done(self, task):
+        # Releases the reference held by spawn and reports errors nobody awaited
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.log_message("Error in background task", repr(task.exception()))
+
+    # ------------------------------------------------------------------------------------------
+    # Function: post_batch
+    # Description: Formats a batch of scheduled messages and posts them to a channel as a
+    #              single Slack message.
+    #
+    # Parameters:
+    #   channel_id (str): The ID of the channel where the messages will be sent.
+    #   messages (list): The messages to be sent, in the order they were queued.
+    #
+    # Returns: None
+    # ------------------------------------------------------------------------------------------
+    async def post_batch(self, channel_id, messages):
+        formatted_messages = [await self.format_message(message) for message in messages]
+        await self.post_message(channel_id, self.OUTBOX_SEPARATOR.join(formatted_messages))
+
+    # ------------------------------------------------------------------------------------------
+    # Function: flush_outbox
+    # Description: Hands the messages queued by scheduled reminders to the sender worker of
+    #              their channel, combining the messages queued for the same channel into one
+    #              batch.
+    #
+    # Returns: None
+    # ------------------------------------------------------------------------------------------
+    def flush_outbox(self):
+        for channel_id, messages in self._outbox.items():
+            self.channel_queue(channel_id).put_nowait(messages)
+        self._outbox.clear()
+
+    # ------------------------------------------------------------------------------------------
+    # Function: channel_queue
+    # Description: Gets the queue of batches of a channel, starting the channel's sender
+    #              worker the first time the channel is posted to.
+    #
+    # Parameters:
+    #   channel_id (str): The ID of the channel.
+    #
+    # Returns:
+    #   asyncio.Queue: The queue read by the channel's sender worker.
+    # ------------------------------------------------------------------------------------------
+    def channel_queue(self, channel_id):
+        queue = self._send_queues.get(channel_id)
+        if queue is None:
+            queue = self._send_queues[channel_id] = asyncio.Queue()
+            self.spawn(self.sender_worker(channel_id, queue))
+        return queue
+
+    # ------------------------------------------------------------------------------------------
+    # Function: sender_worker
+    # Description: Posts the batches of one channel handed over by flush_outbox, one at a
+    #              time and in order. The channel is posted to at most once every
+    #              CHANNEL_POST_INTERVAL seconds. Every channel has its own worker, so a slow
+    #              or rate limited channel only delays its own batches.
+    #
+    # Parameters:
+    #   channel_id (str): The ID of the channel the worker posts to.
+    #   queue (asyncio.Queue): The queue of batches of the channel.
+    #
+    # Returns: None
+    #
+    # Warnings: This coroutine runs until it is cancelled. The number of posts in flight
+    #           across all channels is still capped by SLACK_MAX_CONCURRENT_REQUESTS.
+    # ------------------------------------------------------------------------------------------
+    async def sender_worker(self, channel_id, queue):
+        ready_at = 0
+        while True:
+            messages = await queue.get()
+            try:
+                # Waits for the channel's rate limit before posting to it again
+                wait = ready_at - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+                await self.post_batch(channel_id, messages)
+                ready_at = time.monotonic() + self.CHANNEL_POST_INTERVAL
+            except Exception as e:
+                # Keeps the worker alive; a failed batch must not stop the following ones
+                self.log_message("Error sending batch", repr(e))
+            finally:
+                queue.task_done()
+
+    # ------------------------------------------------------------------------------------------
+    # Function: run_pending_tasks
+    # Description: Continuously executes the scheduled tasks that are due, sleeping on the
+    #              event loop until the next task is due. Only the timers at the top of the
+    #              heap are looked at, so a tick costs O(log n) per due task.
+    #
+    # Returns: None
+    #
+    # Warnings: This coroutine runs until it is cancelled. A timer that was missed (e.g. while
+    #           the machine was suspended) fires once, up to TIMER_RECHECK_INTERVAL seconds
+    #           late, then resumes its weekly cadence.
+    #           Timers added while it sleeps are picked up right away (see add_timer).
+    # ------------------------------------------------------------------------------------------
+    async def run_pending_tasks(self):
+        while True:
+            # Runs due jobs, which only queue their messages, and re-arms them for next week
+            now = time.time()
+            while self._timers and self._timers[0][0] <= now:
+                fire_at, _, weekday, time_24h, func = self._timers[0]
+                # Replaces the head with its next occurrence in one sift instead of a pop and a
+                # push; done before calling func, which may add timers of its own
+                next_fire_at = self.shared_fire_time(weekday, time_24h, max(fire_at, now))
+                heapq.heapreplace(self._timers, (next_fire_at, next(self._timer_seq), weekday, time_24h, func))
+                func()
+
+            # Hands the queued messages to the sender worker in per-channel batches, so a slow
+            # Slack call never delays the next job
+            self.flush_outbox()
+
+            # Wakes when the next job is due, or earlier when add_timer registers a job due
+            # before it; capped so the wall clock is rechecked after a suspend
+            recheck = self.TIMER_RECHECK_INTERVAL
+            idle = self._timers[0][0] - time.time() if self._timers else recheck
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=max(0, min(idle, recheck)))
+            except asyncio.TimeoutError:
+                pass
+
+    # ------------------------------------------------------------------------------------------
+    # Function: push_schedule_to_slack
+    # Description: Hands the registered reminders due in the next horizon_days days to Slack
+    #              with chat.scheduleMessage, so Slack delivers them even while this process
+    #              is not running. Reminders due at the same time in the same channel are
+    #              combined into one message, as flush_outbox does.
+    #
+    # Parameters:
+    #   horizon_days (int): The number of days ahead to schedule. Defaults to
+    #                       SCHEDULE_PUSH_HORIZON_DAYS.
+    #
+    # Returns: None
+    #
+    # Warnings: Time slots that already hold this bot's message with the same text are
+    #           skipped, so this can be called repeatedly to top up the window. A slot whose
+    #           text changed, e.g. a reminder was added to it or edited before a restart, is
+    #           deleted and scheduled again; a slot left without reminders is deleted. This
+    #           bot's messages are known from SCHEDULE_RECORD_FILE, which is saved after every
+    #           pass; messages scheduled by anything else are left alone. Slack accepts
+    #           post_at times at most 120 days ahead.
+    # ------------------------------------------------------------------------------------------
+    async def push_schedule_to_slack(self, horizon_days=None):
+        if horizon_days is None:
+            horizon_days = self.SCHEDULE_PUSH_HORIZON_DAYS
+        if self._slack_unclaimed is None:
+            await self.load_slack_scheduled_messages()
+
+        now = time.time()
+        horizon = now + horizon_days * 86400
+        batches = await self.build_slack_batches(now, horizon)
+
+        # Forgets the occurrences that Slack has delivered by now
+        for scheduled in (self._slack_scheduled, self._slack_unclaimed):
+            for key in [key for key in scheduled if key[1] <= now]:
+                del scheduled[key]
+        self.claim_slack_scheduled_messages(batches)
+
+        # Slots to (re)schedule: new ones, and ours in the window whose text no longer matches
+        stale = {key for key, (_, text) in self._slack_scheduled.items()
+                 if key[1] <= horizon and batches.get(key) != text}
+        keys = stale.union(key for key in batches if key not in self._slack_scheduled)
+
+        # Schedules the batches a few calls at a time; a stale slot is only scheduled again
+        # once its old message is gone, so Slack never posts both
+        limit = asyncio.Semaphore(self.SCHEDULE_PUSH_CONCURRENCY)
+
+        async def push(key):
+            async with limit:
+                if key in stale and not await self.delete_slack_scheduled_message(key):
+                    return
+                if key in batches:
+                    await self.schedule_slack_message(key[0], key[1], batches[key])
+
+        self.log_message("Scheduling", f"Scheduling {len(keys)} messages on Slack for the next {horizon_days} days")
+        try:
+            await asyncio.gather(*(push(key) for key in keys))
+        finally:
+            # Records what was scheduled even if some calls failed
+            self.save_slack_schedule_record()
+
+    # ------------------------------------------------------------------------------------------
+    # Function: build_slack_batches
+    # Description: Expands the registered reminders into their occurrences between two
+    #              moments and formats the message of every time slot, combining the reminders
+    #              due at the same time in the same channel in their registration order.
+    #
+    # Parameters:
+    #   now (float): The epoch timestamp the occurrences must be later than.
+    #   horizon (float): The epoch timestamp of the last occurrence to include.
+    #
+    # Returns:
+    #   dict: The formatted message text of each (channel ID, post_at) slot.
+    # ------------------------------------------------------------------------------------------
+    async def build_slack_batches(self, now, horizon):
+        # Resolves the channels once; Slack reports the scheduled messages by channel ID
+        channel_ids = {}
+        for channel in {reminder[0] for reminder in self._scheduled_reminders}:
+            channel_ids[channel] = await self.get_channel_id(channel)
+            if channel_ids[channel] is None:
+                self.log_message("Channel not found", f"Channel {channel} could not be resolved to a channel ID.")
+
+        # Tags every occurrence with its job ID so batches keep the registration order
+        batches = collections.defaultdict(list)
+        for channel, day, time_24h, message in self._scheduled_reminders:
+            channel_id = channel_ids[channel]
+            if channel_id is None:
+                continue
+            job_id = self._job_ids[(channel, message)]
+            weekday = self._DAY_IDX[day]
+            post_at = self.next_fire_time(weekday, time_24h, now)
+            while post_at <= horizon:
+                batches[(channel_id, int(post_at))].append((job_id, message))
+                post_at = self.next_fire_time(weekday, time_24h, post_at)
+
+        formatted_batches = {}
+        for key, messages in batches.items():
+            messages.sort()
+            formatted_messages = [await self.format_message(message) for _, message in messages]
+            formatted_batches[key] = self.OUTBOX_SEPARATOR.join(formatted_messages)
+        return formatted_batches
+
+    # ------------------------------------------------------------------------------------------
+    # Function: claim_slack_scheduled_messages
+    # Description: Fallback for the messages this bot scheduled but did not record, e.g. when
+    #              SCHEDULE_RECORD_FILE was lost or the process stopped before saving it: a
+    #              listed message is claimed when it has the exact text this bot would
+    #              schedule in a time slot that has no recorded message.
+    #
+    # Parameters:
+    #   batches (dict): The formatted message of each slot, as built by build_slack_batches.
+    #
+    # Returns: None
+    #
+    # Warnings: An unrecorded message whose text has changed since cannot be told apart from
+    #           someone else's, so it is not claimed; Slack still posts it.
+    # ------------------------------------------------------------------------------------------
+    def claim_slack_scheduled_messages(self, batches):
+        for key, text in batches.items():
+            if key in self._slack_scheduled:
+                continue
+            unclaimed = self._slack_unclaimed.get(key, [])
+            for entry in unclaimed:
+                if entry[1] == text:
+                    self._slack_scheduled[key] = entry
+                    unclaimed.remove(entry)
+                    break
+
+    # ------------------------------------------------------------------------------------------
+    # Function: schedule_slack_message
+    # Description: Schedules an already formatted message on Slack with chat.scheduleMessage
+    #              and records its scheduled message ID and text.
+    #
+    # Parameters:
+    #   channel_id (str): The ID of the channel where the message will be posted.
+    #   post_at (int): The epoch timestamp at which Slack posts the message.
+    #   formatted_message (str): The message, with mentions already converted to Slack tags.
+    #
+    # Returns: None
+    #
+    # Warnings: Rate limited calls are retried after the delay Slack asks for; other errors
+    #           are logged and the occurrence is retried on the next push.
+    # ------------------------------------------------------------------------------------------
+    async def schedule_slack_message(self, channel_id, post_at, formatted_message):
+        while True:
+            try:
+                response = await self.client.chat_scheduleMessage(
+                    channel=channel_id, post_at=post_at, text=formatted_message)
+                self._slack_scheduled[(channel_id, post_at)] = (response["scheduled_message_id"], formatted_message)
+                return
+            except SlackApiError as e:
+                if e.response.status_code == 429:
+                    retry_after = int(e.response.headers.get("Retry-After", 1))
+                    await asyncio.sleep(retry_after)
+                    continue
+                self.log_message("Error scheduling message", f"{e.response['error']}")
+                return
+
+    # ------------------------------------------------------------------------------------------
+    # Function: delete_slack_scheduled_message
+    # Description: Deletes one of this bot's messages scheduled on Slack with
+    #              chat.deleteScheduledMessage and forgets it.
+    #
+    # Parameters:
+    #   key (tuple): The (channel ID, post_at) slot of the message.
+    #
+    # Returns:
+    #   bool: True if the message is gone from Slack, False if it could not be deleted.
+    #
+    # Warnings: Rate limited calls are retried after the delay Slack asks for. A message that
+    #           Slack is about to post (within a minute or so) may not be deletable any more;
+    #           the error is logged and the message is kept.
+    # ------------------------------------------------------------------------------------------
+    async def delete_slack_scheduled_message(self, key):
+        while True:
+            try:
+                await self.client.chat_deleteScheduledMessage(
+                    channel=key[0], scheduled_message_id=self._slack_scheduled[key][0])
+                break
+            except SlackApiError as e:
+                if e.response.status_code == 429:
+                    await asyncio.sleep(int(e.response.headers.get("Retry-After", 1)))
+                    continue
+                # A message that was already deleted or posted is gone all the same
+                if e.response['error'] == "invalid_scheduled_message_id":
+                    break
+                self.log_message("Error deleting scheduled message", f"{e.response['error']}")
+                return False
+        del self._slack_scheduled[key]
+        return True
+
+    # ------------------------------------------------------------------------------------------
+    # Function: load_slack_scheduled_messages
+    # Description: Reads the record of this bot's scheduled messages and fetches the messages
+    #              scheduled on Slack by this token. Recorded messages that Slack no longer
+    #              lists were posted or deleted and are forgotten; listed messages that are
+    #              not recorded are kept apart, for claim_slack_scheduled_messages.
+    #
+    # Returns: None
+    # ------------------------------------------------------------------------------------------
+    async def load_slack_scheduled_messages(self):
+        if self._slack_scheduled is None:
+            self._slack_scheduled = self.read_slack_schedule_record()
+
+        listed = {}
+        cursor = None
+        while True:
+            response = await self.client.chat_scheduledMessages_list(cursor=cursor, limit=100)
+            for item in response["scheduled_messages"]:
+                listed[item["id"]] = ((item["channel_id"], int(item["post_at"])), item.get("text", ""))
+            cursor = response.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                break
+
+        for key, (message_id, _) in list(self._slack_scheduled.items()):
+            if listed.pop(message_id, None) is None:
+                del self._slack_scheduled[key]
+
+        unclaimed = collections.defaultdict(list)
+        for message_id, (key, text) in listed.items():
+            unclaimed[key].append((message_id, text))
+        self._slack_unclaimed = dict(unclaimed)
+
+    # ------------------------------------------------------------------------------------------
+    # Function: read_slack_schedule_record
+    # Description: Reads SCHEDULE_RECORD_FILE, the record of the messages this bot scheduled
+    #              on Slack.
+    #
+    # Returns:
+    #   dict: (channel ID, post_at) -> (scheduled message ID, text); empty without a record.
+    #
+    # Warnings: An unreadable record is logged and treated as empty.
+    # ------------------------------------------------------------------------------------------
+    def read_slack_schedule_record(self):
+        try:
+            with open(self.SCHEDULE_RECORD_FILE, encoding="utf-8") as record_file:
+                record = json.load(record_file)
+            return {(item["channel_id"], int(item["post_at"])): (item["id"], item["text"])
+                    for item in record["scheduled_messages"]}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.log_message("Error reading scheduled messages record", repr(e))
+            return {}
+
+    # ------------------------------------------------------------------------------------------
+    # Function: save_slack_schedule_record
+    # Description: Writes the messages this bot has scheduled on Slack to SCHEDULE_RECORD_FILE.
+    #              The file is replaced in one step, so a crash never leaves half a record.
+    #
+    # Returns: None
+    # ------------------------------------------------------------------------------------------
+    def save_slack_schedule_record(self):
+        record = {"scheduled_messages": [
+            {"channel_id": channel_id, "post_at": post_at, "id": message_id, "text": text}
+            for (channel_id, post_at), (message_id, text) in sorted(self._slack_scheduled.items())]}
+        temp_path = self.SCHEDULE_RECORD_FILE + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as record_file:
+                json.dump(record, record_file, ensure_ascii=False, indent=1)
+            os.replace(temp_path, self.SCHEDULE_RECORD_FILE)
+        except OSError as e:
+            self.log_message("Error saving scheduled messages record", repr(e))
+
+    # ------------------------------------------------------------------------------------------
+    # Function: cancel_slack_scheduled_messages
+    # Description: Deletes this bot's reminders scheduled on Slack. Called when the scheduler
+    #              starts with slack_scheduled_messages disabled, as the reminders are then
+    #              posted from this process and Slack would post them a second time.
+    #
+    # Parameters:
+    #   channel_id (str): Only cancels the messages of this channel, given by ID or name.
+    #                     Defaults to all channels.
+    #
+    # Returns: None
+    #
+    # Warnings: Only the messages in SCHEDULE_RECORD_FILE are deleted; without a record,
+    #           nothing is sent to Slack at all. Messages that Slack is about to post (within
+    #           a minute or so) may not be cancellable any more; errors are logged.
+    # ------------------------------------------------------------------------------------------
+    async def cancel_slack_scheduled_messages(self, channel_id=None):
+        if self._slack_scheduled is None:
+            self._slack_scheduled = self.read_slack_schedule_record()
+        if not self._slack_scheduled:
+            return
+
+        # Forgets the occurrences that Slack has delivered by now
+        now = time.time()
+        for key in [key for key in self._slack_scheduled if key[1] <= now]:
+            del self._slack_scheduled[key]
+
+        channel = channel_id
+        if channel is not None:
+            channel_id = await self.get_channel_id(channel)
+            if channel_id is None:
+                self.log_message("Channel not found", f"Channel {channel} could not be resolved to a channel ID.")
+                return
+
+        keys = [key for key in self._slack_scheduled if channel_id is None or key[0] == channel_id]
+        limit = asyncio.Semaphore(self.SCHEDULE_PUSH_CONCURRENCY)
+
+        async def cancel(key):
+            async with limit:
+                await self.delete_slack_scheduled_message(key)
+
+        try:
+            await asyncio.gather(*(cancel(key) for key in keys))
+        finally:
+            self.save_slack_schedule_record()
+        self.log_message("Scheduling", f"Cancelled {len(keys)} messages scheduled on Slack for {channel or 'all channels'}")
+
+    # ------------------------------------------------------------------------------------------
+    # Function: push_schedule_loop
+    # Description: Keeps the reminders of the coming days scheduled on Slack, topping up the
+    #              window every SCHEDULE_PUSH_INTERVAL seconds. Used instead of
+    #              run_pending_tasks when slack_scheduled_messages is enabled.
+    #
+    # Returns: None
+    #
+    # Warnings: This coroutine runs until it is cancelled. A pass that fails, e.g. on a Slack
+    #           API or network error, is logged and retried on the next interval; the
+    #           reminders already scheduled on Slack are still delivered meanwhile.
+    # ------------------------------------------------------------------------------------------
+    async def push_schedule_loop(self):
+        while True:
+            try:
+                await self.push_schedule_to_slack()
+            except Exception as e:
+                # Keeps the loop alive; a failed pass must not stop the scheduler
+                self.log_message("Error scheduling messages on Slack", repr(e))
+            await asyncio.sleep(self.SCHEDULE_PUSH_INTERVAL)
+
+    # ------------------------------------------------------------------------------------------
+    # Function: start
+    # Description: Opens the shared HTTP session used by the Slack client and starts warming
+    #              the user cache. Must be called on the event loop that runs the scheduler.
+    #
+    # Returns: None
+    # ------------------------------------------------------------------------------------------
+    async def start(self):
+        # One HTTP session for the lifetime of the loop, so TLS handshakes are not repeated per
+        # call; idle connections are kept well past aiohttp's 15 second default, so reminders
+        # that fire a few minutes apart still find an open connection. The pool covers the
+        # posts and the chat.scheduleMessage pushes running at once, and slack.com is only
+        # resolved again once a connection has had time to expire
+        connector = aiohttp.TCPConnector(
+            limit=self.HTTP_POOL_SIZE,
+            keepalive_timeout=self.HTTP_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=self.HTTP_KEEPALIVE_TIMEOUT)
+        self._http_session = aiohttp.ClientSession(connector=connector)
+        self.client.session = self._http_session
+
+        # Fetches the user list and prepares the configured messages in the background
+        self.spawn(self.warm_user_cache())
+
+    # ------------------------------------------------------------------------------------------
+    # Function: main
+    # Description: Runs the Slack scheduler on the current event loop: listens for commands
+    #              and executes scheduled tasks. On exit, the background tasks are cancelled
+    #              before the HTTP session they use is closed.
+    #
+    # Returns: None
+    #
+    # Warnings: This coroutine runs until it is cancelled.
+    # ------------------------------------------------------------------------------------------
+    async def main(self):
+        await self.start()
+        try:
+            self.listen_for_commands(asyncio.get_running_loop())
+            # Either Slack delivers the reminders, or they are fired from this process
+            if self.config["enable_features"].get("slack_scheduled_messages", False):
+                await self.push_schedule_loop()
+            else:
+                # Reminders handed to Slack while the feature was enabled would be posted twice
+                self.spawn(self.cancel_slack_scheduled_messages())
+                await self.run_pending_tasks()
+        finally:
+            await self.shutdown()
+
+    # ------------------------------------------------------------------------------------------
+    # Function: shutdown
+    # Description: Stops watching stdin, cancels the background tasks and closes the shared
+    #              HTTP session.
+    #
+    # Returns: None
+    # ------------------------------------------------------------------------------------------
+    async def shutdown(self):
+        # Unregisters stdin, so no command is read once the command worker is gone
+        if self._stdin_buffer is not None:
+            asyncio.get_running_loop().remove_reader(sys.stdin.fileno())
+            self._stdin_buffer = None
+
+        # Stops the background tasks first, so none of them posts on a closed session
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._send_queues = {}
+
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
 
     # ------------------------------------------------------------------------------------------
     # Function: run
-    # Description: Initiates the Slack scheduler, starting a thread to listen for commands
-    #              and continuously executing scheduled tasks.
+    # Description: Initiates the Slack scheduler on an event loop that both listens for
+    #              commands and executes scheduled tasks. The loop wakes when the next
+    #              task is due rather than on a fixed interval.
     #
     # Returns: None
     #
-    # Warnings: This function initiates an infinite loop for listening to commands.
+    # Warnings: This function runs the event loop indefinitely. The process can be pinned to a
+    #           CPU with SLACK_SCHEDULER_CPU and niced with SLACK_SCHEDULER_NICE (environment,
+    #           unset by default); either is ignored where the platform does not support it.
     #
     # History:
     #   01/04/23 - Function created by George Manea
     # ------------------------------------------------------------------------------------------
     def run(self):
-        # Initiates the Slack scheduler, running in its own thread to listen for commands
-        command_thread = threading.Thread(target=self.listen_for_commands)
-        command_thread.daemon = True
-        command_thread.start()
+        # Keeps the mostly idle scheduler on one core and behind heavier work when asked to
+        cpu = os.environ.get("SLACK_SCHEDULER_CPU")
+        if cpu is not None and hasattr(os, "sched_setaffinity"):
+            try:
+                os.sched_setaffinity(0, {int(cpu)})
+            except (OSError, ValueError) as e:
+                self.log_message("Scheduling", f"Could not pin to CPU {cpu!r} (SLACK_SCHEDULER_CPU): {e}")
 
-        # Continuously checks and executes pending scheduled tasks
-        while True:
-            schedule.run_pending()
-            # Waits for a minute before checking for pending tasks again
-            time.sleep(60)
+        niceness = os.environ.get("SLACK_SCHEDULER_NICE")
+        if niceness is not None and hasattr(os, "nice"):
+            try:
+                os.nice(int(niceness))
+            except (OSError, ValueError) as e:
+                self.log_message("Scheduling", f"Could not apply nice {niceness!r} (SLACK_SCHEDULER_NICE): {e}")
+
+        # Commands, scheduled tasks and Slack API calls share a single event loop on this thread
+        asyncio.run(self.main())
+
+# ------------------------------------------------------------------------------------------
+# Function: _compile_config
+# Description: Precomputes the scheduling data derived from the config, so that scheduling
+#              does not have to parse the 12-hour time keys or walk the nested dicts:
+#                - every shift becomes a ShiftConfig holding its days and its messages as
+#                  (24-hour time, message) tuples sorted by time;
+#                - every meeting reminder becomes a MeetingConfig with its 24-hour time.
+#              Day names are checked against SlackScheduler._DAY_IDX along the way.
+#
+# Parameters:
+#   config (dict): The scheduler configuration to compile.
+#
+# Returns:
+#   CompiledConfig: The shifts, as a read-only mapping by shift type, and the meetings.
+#
+# Warnings: Raises ValueError for an unknown day name. To change shift or meeting reminders
+#           at runtime, compile the new config and assign it to SlackScheduler.compiled_config.
+# ------------------------------------------------------------------------------------------
+def _compile_config(config):
+    def check_days(days, where):
+        for day in days:
+            if day not in SlackScheduler._DAY_IDX:
+                raise ValueError(f"Unknown day '{day}' in {where}")
+        return tuple(days)
+
+    shifts = {}
+    for shift_type, shift_config in config["shift_message_config"].items():
+        days = check_days(shift_config.get("days", []), shift_type)
+        messages = tuple(sorted(
+            (_to_24h(time_key), message) for time_key, message in shift_config.get("messages", {}).items()))
+        shifts[shift_type] = ShiftConfig(days, messages)
+
+    meetings = []
+    for time_key, info in config["meeting_reminders"].items():
+        days = check_days(info["days"], f"meeting reminder at {time_key}")
+        meetings.append(MeetingConfig(time_key, _to_24h(time_key), days, info["message"]))
+
+    return CompiledConfig(types.MappingProxyType(shifts), tuple(meetings))
+
+# Compiles the class-level configuration once, at module load
+SlackScheduler.compiled_config = _compile_config(SlackScheduler.config)
 
 # Example Implementation
+# Printing log records with the same "HH:MM AM/PM - action: message" layout as before
+log_handler = logging.StreamHandler()
+log_handler.setFormatter(MinuteFormatter("%(asctime)s - %(message)s", datefmt="%I:%M %p"))
+logging.basicConfig(level=logging.INFO, handlers=[log_handler])
+
 # Creating an instance of SlackScheduler with an API key
 slack_scheduler = SlackScheduler("Your API Key")
 